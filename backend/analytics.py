@@ -0,0 +1,257 @@
+from collections import Counter, defaultdict
+from datetime import datetime
+import json
+import os
+import threading
+
+from questions import EXCEL_QUESTIONS
+
+PASS_THRESHOLD = 70.0  # Same cut-off as a "Good answer" in the evaluation feedback
+PASS_RATE_DAYS = 30    # Days of pass rates kept, bounding memory and /analytics cost
+FLUSH_INTERVAL_SECONDS = 5.0
+# The backend engine and the frontend heuristic score on different scales,
+# so each source keeps its own aggregates
+SCORE_SOURCES = ("backend", "frontend")
+ANALYTICS_PATH = os.environ.get(
+    'ANALYTICS_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analytics_state.json')
+)
+
+
+class ScoreSketch:
+    """Mergeable quantile sketch for scores in the 0-100 range.
+
+    Scores are bounded, so a fixed histogram of 0.5-point bins gives exact
+    counts, constant-time inserts and quantiles accurate to half a point.
+    Two sketches merge by adding their bins.
+    """
+
+    BIN_WIDTH = 0.5
+    NUM_BINS = int(100 / BIN_WIDTH) + 1
+
+    def __init__(self):
+        self.bins = [0] * self.NUM_BINS
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, score: float):
+        score = min(max(score, 0.0), 100.0)
+        self.bins[int(score / self.BIN_WIDTH)] += 1
+        self.count += 1
+        self.total += score
+
+    def merge(self, other: "ScoreSketch"):
+        for i, n in enumerate(other.bins):
+            self.bins[i] += n
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = 0
+        for i, n in enumerate(self.bins):
+            seen += n
+            if seen > rank:
+                return i * self.BIN_WIDTH
+        return 100.0
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else 0.0,
+            "p25": self.quantile(0.25),
+            "p50": self.quantile(0.50),
+            "p75": self.quantile(0.75),
+            "p90": self.quantile(0.90),
+        }
+
+    def to_dict(self) -> dict:
+        return {"bins": list(self.bins), "count": self.count, "total": self.total}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScoreSketch":
+        sketch = cls()
+        sketch.bins = list(data["bins"])
+        sketch.count = data["count"]
+        sketch.total = data["total"]
+        return sketch
+
+
+class CohortAggregates:
+    """Per-question aggregates for one scoring source.
+
+    Only per-question data is stored; overall, per-difficulty and global
+    keyword figures are merged from it on demand, so they always agree.
+    """
+
+    def __init__(self):
+        self.by_question = defaultdict(ScoreSketch)
+        self.missed_by_question = defaultdict(Counter)
+        self.passes_by_day = defaultdict(dict)  # day -> question -> [passed, total]
+
+    def add(self, question: str, score: float, missing: list, day: str):
+        self.by_question[question].add(score)
+        self.missed_by_question[question].update(missing)
+        day_counts = self.passes_by_day[day].setdefault(question, [0, 0])
+        day_counts[0] += score >= PASS_THRESHOLD
+        day_counts[1] += 1
+        self._prune_days()
+
+    def _prune_days(self):
+        for day in sorted(self.passes_by_day)[:-PASS_RATE_DAYS]:
+            del self.passes_by_day[day]
+
+    def snapshot(self, questions: dict, top_keywords: int, days: int) -> dict:
+        overall = ScoreSketch()
+        by_difficulty = defaultdict(ScoreSketch)
+        missed_keywords = Counter()
+        for q, sketch in self.by_question.items():
+            overall.merge(sketch)
+            by_difficulty[questions[q]["difficulty"]].merge(sketch)
+            missed_keywords.update(self.missed_by_question[q])
+
+        pass_rates = []
+        for day in sorted(self.passes_by_day)[-days:]:
+            passed = sum(c[0] for c in self.passes_by_day[day].values())
+            total = sum(c[1] for c in self.passes_by_day[day].values())
+            pass_rates.append({"date": day, "evaluations": total, "pass_rate": round(passed / total, 4)})
+
+        return {
+            "total_evaluations": overall.count,
+            "overall": overall.summary(),
+            "by_difficulty": {d: s.summary() for d, s in by_difficulty.items()},
+            "by_question": [
+                {
+                    "question": q,
+                    "difficulty": questions[q]["difficulty"],
+                    "scores": s.summary(),
+                    "most_missed_keywords": [kw for kw, _ in self.missed_by_question[q].most_common(3)],
+                }
+                for q, s in self.by_question.items()
+            ],
+            "most_missed_keywords": [
+                {"keyword": kw, "count": n} for kw, n in missed_keywords.most_common(top_keywords)
+            ],
+            "pass_rate_by_day": pass_rates,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "by_question": {q: s.to_dict() for q, s in self.by_question.items()},
+            "missed_by_question": {q: dict(c) for q, c in self.missed_by_question.items()},
+            "passes_by_day": {
+                day: {q: list(c) for q, c in counts.items()} for day, counts in self.passes_by_day.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, questions: dict) -> "CohortAggregates":
+        """Rebuild the aggregates, dropping questions no longer in the question bank"""
+        aggregates = cls()
+        for q, s in data["by_question"].items():
+            if q in questions:
+                aggregates.by_question[q] = ScoreSketch.from_dict(s)
+        for q, c in data["missed_by_question"].items():
+            if q in questions:
+                aggregates.missed_by_question[q].update(c)
+        for day, counts in data["passes_by_day"].items():
+            kept = {q: list(c) for q, c in counts.items() if q in questions}
+            if kept:
+                aggregates.passes_by_day[day] = kept
+        aggregates._prune_days()
+        return aggregates
+
+
+class AnalyticsStore:
+    """Cohort aggregates updated as each evaluation is recorded.
+
+    Every query reads the running counters and sketches directly, so
+    dashboard cost depends on the number of questions, not interviews.
+    Only questions from the question bank are tracked, which keeps the
+    aggregates bounded. When a path is given, flush() saves changes since
+    the last save and the aggregates are reloaded on startup.
+    """
+
+    def __init__(self, questions: list = EXCEL_QUESTIONS, path: str = None):
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self.questions = {q["question"]: q for q in questions}
+        self.path = path
+        self.sources = {source: CohortAggregates() for source in SCORE_SOURCES}
+        if path and os.path.exists(path):
+            self._load()
+
+    def record(self, question: str, evaluation: dict, source: str = "backend", recorded_at: datetime = None) -> bool:
+        """Fold a single evaluation result into the aggregates.
+
+        Returns False, without recording, for questions outside the question bank.
+        """
+        if source not in self.sources:
+            raise ValueError(f"Unknown score source '{source}'")
+        question_data = self.questions.get(question)
+        if question_data is None:
+            return False
+
+        score = evaluation.get("score", 0)
+        expected = set(question_data["expected_keywords"])
+        missing = [kw for kw in evaluation.get("keywords_missing", []) if kw in expected]
+        day = (recorded_at or datetime.now()).strftime('%Y-%m-%d')
+
+        with self._lock:
+            self.sources[source].add(question, score, missing, day)
+            self._dirty = True
+        return True
+
+    def snapshot(self, source: str = "frontend", top_keywords: int = 10, days: int = PASS_RATE_DAYS) -> dict:
+        """Return the current dashboard view of one source's aggregates"""
+        if source not in self.sources:
+            raise ValueError(f"Unknown score source '{source}'")
+        with self._lock:
+            snapshot = self.sources[source].snapshot(self.questions, top_keywords, days)
+        snapshot["source"] = source
+        return snapshot
+
+    def flush(self):
+        """Save the aggregates if anything was recorded since the last save.
+
+        Meant to run off the event loop; failures are logged and retried on
+        the next flush rather than raised.
+        """
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                state = {source: aggregates.to_dict() for source, aggregates in self.sources.items()}
+                self._dirty = False
+            try:
+                # Write atomically so a crash never leaves a partial file
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"⚠️ Could not save analytics state to {self.path}: {e}")
+                with self._lock:
+                    self._dirty = True
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+            sources = {
+                source: CohortAggregates.from_dict(state[source], self.questions) if source in state
+                else CohortAggregates()
+                for source in SCORE_SOURCES
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ Could not load analytics state from {self.path}: {e}")
+            return
+        self.sources = sources
+
+# Global instance
+analytics_store = AnalyticsStore(path=ANALYTICS_PATH)
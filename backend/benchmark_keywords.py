@@ -0,0 +1,161 @@
+"""Calibrate and benchmark semantic keyword matching against the exact path.
+
+Picks the lowest similarity threshold that keeps precision on the labelled
+phrase/keyword pairs at or above MIN_PRECISION, then times exact vs semantic
+matching on short and long answers and checks which keywords each one credits.
+Semantic matching is off until the reported threshold is set through the
+KEYWORD_SIMILARITY_THRESHOLD environment variable; until then the per-answer
+checks use the calibrated value.
+
+Run from the backend directory:
+    python benchmark_keywords.py
+"""
+import time
+
+import torch
+
+from questions import EXCEL_QUESTIONS
+from evaluation_engine import evaluation_engine
+from keyword_matching import KEYWORD_SIMILARITY_THRESHOLD, answer_ngrams, ngram_sizes, select_threshold
+
+MIN_PRECISION = 0.95
+
+# (answer phrase, keyword, should the phrase earn credit for the keyword)
+LABELLED_PAIRS = [
+    ("ctrl shift enter", "control shift enter", True),
+    ("vertically", "vertical", True),
+    ("horizontally", "horizontal", True),
+    ("searches", "search", True),
+    ("look to the left", "left lookup", True),
+    ("summarise", "summarize", True),
+    ("sums up", "aggregate", True),
+    ("visual basic for applications", "vba", True),
+    ("automates", "automate", True),
+    ("automatically", "automation", True),
+    ("sub procedure", "subroutine", True),
+    ("recorder", "record macro", True),
+    ("colour scales", "color scales", True),
+    ("highlights", "highlight", True),
+    ("spills", "spill range", True),
+    ("n a", "na", True),
+    ("handles", "handle", True),
+    ("fallback value", "alternative", True),
+    ("iserror", "iferror", False),
+    ("iferror", "iserror", False),
+    ("vertically", "horizontal", False),
+    ("horizontally", "vertical", False),
+    ("rows", "columns", False),
+    ("columns", "rows", False),
+    ("row", "column", False),
+    ("hlookup", "vertical", False),
+    ("vlookup", "horizontal", False),
+    ("index", "match", False),
+    ("sum", "array", False),
+    ("formula", "format", False),
+    ("data bars", "color scales", False),
+    ("icon", "highlight", False),
+    ("filter", "fields", False),
+    ("values", "filter", False),
+    ("macro", "module", False),
+    ("error", "clean data", False),
+    ("left", "dynamic", False),
+    ("table", "range", False),
+]
+
+LONG_ARRAY_ANSWER = (
+    "Array formulas let one formula work on a whole range of cells instead of a single value, which is useful "
+    "when you need several intermediate results but only care about the final figure. For example, to total "
+    "revenue without a helper column you can multiply the quantity column by the price column and sum the "
+    "products in one step. In older versions of Excel the formula has to be confirmed in a special way, "
+    "otherwise it only calculates the first element and returns the wrong answer. Curly braces then appear "
+    "around it in the formula bar. I use this for conditional totals, counting unique items and lookups with "
+    "more than one criterion. To enter it you type the formula and press Ctrl+Shift+Enter"
+)
+
+LONG_PIVOT_ANSWER = (
+    "When a manager asks for monthly sales by region I start from the raw export, convert it to a proper table "
+    "so new records are picked up on refresh, and insert a pivot from the Insert tab. I place region down the "
+    "rows and months across the columns, put revenue in the values area set to sum, and add product category "
+    "as a report filter so the same layout can answer several questions. I also group dates by month and "
+    "quarter, format the numbers as currency and sort regions by total so the largest markets come first. "
+    "Finally I add a slicer so people without Excel experience can click through categories themselves and "
+    "sum up the results without touching the underlying data or formulas at all."
+)
+
+# (index into EXCEL_QUESTIONS, answer, keywords the semantic path should add on top of exact matches)
+SAMPLE_ANSWERS = [
+    (0, "VLOOKUP looks up vertically down the first column while HLOOKUP searches horizontally across the top row of a table.",
+        set()),
+    (2, "Enter the formula and press Ctrl+Shift+Enter so it calculates over the whole array at once.",
+        {"control shift enter"}),
+    (2, LONG_ARRAY_ANSWER, {"control shift enter"}),
+    (3, LONG_PIVOT_ANSWER, {"aggregate"}),
+    (4, "I would record a macro, then open the editor and tidy up the generated Visual Basic sub so it automates the report.",
+        {"automate"}),
+    (6, "Wrap the lookup in IFERROR so that #N/A results show a friendly alternative instead of breaking the sheet.",
+        set()),
+    (6, "I would use ISERROR inside an IF to check whether the value is an error.",
+        set()),
+]
+
+def time_per_call(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+def calibrate():
+    """Score the labelled pairs and report the threshold that meets MIN_PRECISION"""
+    model = evaluation_engine.similarity_model
+    phrases = model.encode([p for p, _, _ in LABELLED_PAIRS], convert_to_tensor=True, normalize_embeddings=True)
+    keywords = model.encode([k for _, k, _ in LABELLED_PAIRS], convert_to_tensor=True, normalize_embeddings=True)
+    similarities = (phrases * keywords).sum(dim=1).tolist()
+    scored_pairs = [(score, label) for score, (_, _, label) in zip(similarities, LABELLED_PAIRS)]
+
+    for score, (phrase, keyword, label) in sorted(zip(similarities, LABELLED_PAIRS), reverse=True):
+        print(f"  {score:6.3f}  {'+' if label else '-'}  {phrase!r} -> {keyword!r}")
+
+    selected = select_threshold(scored_pairs, MIN_PRECISION)
+    print(f"Configured threshold {KEYWORD_SIMILARITY_THRESHOLD}")
+    if selected is None:
+        print(f"No threshold reaches {MIN_PRECISION:.0%} precision")
+        return None
+    threshold, precision, recall = selected
+    print(f"Selected threshold {threshold:.3f}: precision {precision:.2%}, recall {recall:.2%}")
+    return threshold
+
+def main(repeats: int = 20):
+    evaluation_engine.load_models()
+    if not evaluation_engine.models_loaded:
+        print("Models not available, nothing to benchmark")
+        return
+
+    print("Threshold calibration on labelled pairs:")
+    with torch.no_grad():
+        selected = calibrate()
+    threshold = KEYWORD_SIMILARITY_THRESHOLD if KEYWORD_SIMILARITY_THRESHOLD is not None else selected
+    if threshold is None:
+        return
+
+    for index, answer, expected_extra in SAMPLE_ANSWERS:
+        question_data = EXCEL_QUESTIONS[index]
+        keywords = question_data["expected_keywords"]
+        exact = [kw for kw in keywords if kw.lower() in answer.lower()]
+
+        # Warm the keyword matrix cache, as repeated questions would in production
+        semantic = evaluation_engine._match_keywords_semantically(keywords, exact, answer, threshold)
+
+        exact_ms = time_per_call(lambda: [kw for kw in keywords if kw.lower() in answer.lower()], repeats)
+        semantic_ms = time_per_call(
+            lambda: evaluation_engine._match_keywords_semantically(keywords, exact, answer, threshold), repeats
+        )
+
+        print(f"\nQ: {question_data['question']} ({len(answer.split())} words)")
+        print(f"  exact    {exact_ms:8.3f} ms  found: {exact}")
+        print(f"  semantic {semantic_ms:8.3f} ms  extra: {semantic}")
+        print(f"  n-grams  {len(answer_ngrams(answer, ngram_sizes(keywords)))}")
+        if set(semantic) != expected_extra:
+            print(f"  ❌ expected extra {sorted(expected_extra)}")
+
+if __name__ == "__main__":
+    main()
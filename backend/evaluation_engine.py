@@ -8,24 +8,49 @@ from transformers import pipeline
 import numpy as np
 from collections import Counter
 
+from keyword_matching import KEYWORD_SIMILARITY_THRESHOLD, answer_ngrams, candidate_mask, ngram_sizes
+from questions import EXCEL_QUESTIONS
+
+# Only question bank keyword lists are cached, so client input cannot grow the cache
+KNOWN_KEYWORD_SETS = {tuple(q["expected_keywords"]) for q in EXCEL_QUESTIONS}
+
+SIMILARITY_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+# Scoring mode: "dual" runs DistilBERT for quality, "single" scores quality with a
+# logistic regression head on the MiniLM response embedding (see train_quality_head.py)
+SCORING_MODES = ("dual", "single")
+SCORING_MODE = os.environ.get('SCORING_MODE', 'dual').lower()
+QUALITY_HEAD_PATH = os.environ.get(
+    'QUALITY_HEAD_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quality_head.npz')
+)
+
 class EvaluationEngine:
-    def __init__(self):
+    def __init__(self, scoring_mode: str = SCORING_MODE):
+        if scoring_mode not in SCORING_MODES:
+            raise ValueError(f"Unknown SCORING_MODE '{scoring_mode}', expected one of {', '.join(SCORING_MODES)}")
+        self.scoring_mode = scoring_mode
         self.similarity_model = None
         self.classifier = None
+        self.quality_head = None  # (weights, bias) used in single-encoder mode
         self.models_loaded = False
+        self.keyword_matrices = {}  # tuple(keywords) -> normalized embedding matrix
         
     def load_models(self):
         """Load Hugging Face models"""
         try:
             print("🔄 Loading AI models...")
             # Load similarity model
-            self.similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.similarity_model = SentenceTransformer(SIMILARITY_MODEL_NAME)
             
-            # Load sentiment/quality classifier
-            self.classifier = pipeline(
-                "text-classification",
-                model="distilbert-base-uncased-finetuned-sst-2-english"
-            )
+            if self.scoring_mode == "single":
+                # Quality head on the MiniLM embedding, no second transformer
+                self.quality_head = self._load_quality_head(QUALITY_HEAD_PATH)
+            else:
+                # Load sentiment/quality classifier
+                self.classifier = pipeline(
+                    "text-classification",
+                    model="distilbert-base-uncased-finetuned-sst-2-english"
+                )
             
             self.models_loaded = True
             print("✅ AI models loaded successfully!")
@@ -38,6 +63,15 @@ class EvaluationEngine:
         
         # Basic keyword matching (fallback)
         found_keywords = [kw for kw in expected_keywords if kw.lower() in user_response.lower()]
+        
+        # Semantic keyword matching catches paraphrases the substring check misses
+        if (self.models_loaded and KEYWORD_SIMILARITY_THRESHOLD is not None
+                and len(found_keywords) < len(expected_keywords)):
+            try:
+                found_keywords += self._match_keywords_semantically(expected_keywords, found_keywords, user_response)
+            except Exception as e:
+                print(f"Semantic keyword matching failed: {e}")
+        
         keyword_score = len(found_keywords) / len(expected_keywords) if expected_keywords else 0
         
         # Response length analysis
@@ -52,8 +86,11 @@ class EvaluationEngine:
                 similarity_score = util.pytorch_cos_sim(question_embedding, response_embedding).item()
                 
                 # Response quality assessment
-                quality_result = self.classifier(user_response[:512])
-                quality_score = quality_result[0]['score'] if quality_result[0]['label'] == 'POSITIVE' else 1 - quality_result[0]['score']
+                if self.scoring_mode == "single":
+                    quality_score = self._score_quality(response_embedding)
+                else:
+                    quality_result = self.classifier(user_response[:512])
+                    quality_score = quality_result[0]['score'] if quality_result[0]['label'] == 'POSITIVE' else 1 - quality_result[0]['score']
                 
                 # Combined score with weights
                 final_score = (
@@ -81,6 +118,57 @@ class EvaluationEngine:
             "confidence": 0.8 if self.models_loaded else 0.5
         }
 
+    def _load_quality_head(self, path: str):
+        """Load logistic regression weights written by train_quality_head.py"""
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"Quality head not found at {path}; run train_quality_head.py before using SCORING_MODE=single"
+            )
+        with np.load(path) as head:
+            return head["weights"], float(head["bias"])
+
+    def _score_quality(self, response_embedding):
+        """Quality probability from the already computed MiniLM response embedding"""
+        weights, bias = self.quality_head
+        logit = float(np.dot(response_embedding.cpu().numpy(), weights) + bias)
+        return float(1 / (1 + np.exp(-logit)))
+
+    def _keyword_matrix(self, expected_keywords: list):
+        """Embed a question's keywords once and cache the normalized matrix"""
+        key = tuple(expected_keywords)
+        if key in self.keyword_matrices:
+            return self.keyword_matrices[key]
+        
+        matrix = self.similarity_model.encode(
+            [kw.lower() for kw in expected_keywords],
+            convert_to_tensor=True,
+            normalize_embeddings=True
+        )
+        if key in KNOWN_KEYWORD_SETS:
+            self.keyword_matrices[key] = matrix
+        return matrix
+
+    def _match_keywords_semantically(self, expected_keywords: list, found_keywords: list, user_response: str,
+                                     threshold: float = KEYWORD_SIMILARITY_THRESHOLD):
+        """Return missing keywords that an answer n-gram paraphrases closely enough"""
+        ngrams = answer_ngrams(user_response, ngram_sizes(expected_keywords))
+        if not ngrams:
+            return []
+        
+        keyword_matrix = self._keyword_matrix(expected_keywords)
+        ngram_matrix = self.similarity_model.encode(ngrams, convert_to_tensor=True, normalize_embeddings=True)
+        
+        # One matrix multiply gives every n-gram/keyword cosine similarity;
+        # pairs with mismatched lengths or naming another keyword are ruled out
+        similarities = torch.matmul(ngram_matrix, keyword_matrix.T)
+        allowed = torch.tensor(candidate_mask(ngrams, expected_keywords), device=similarities.device)
+        best_scores = similarities.masked_fill(~allowed, -1.0).max(dim=0).values.tolist()
+        
+        return [
+            kw for kw, best in zip(expected_keywords, best_scores)
+            if kw not in found_keywords and best >= threshold
+        ]
+
     def _generate_feedback(self, score: float, difficulty: str):
         """Generate feedback based on score and difficulty"""
         if score >= 85:
@@ -0,0 +1,112 @@
+import os
+import re
+
+# Semantic keyword matching settings. Matching stays off until a threshold
+# calibrated with benchmark_keywords.py is configured, since it changes scores.
+KEYWORD_SIMILARITY_THRESHOLD = (
+    float(os.environ['KEYWORD_SIMILARITY_THRESHOLD']) if os.environ.get('KEYWORD_SIMILARITY_THRESHOLD') else None
+)
+NGRAM_LENGTH_TOLERANCE = 1  # Max word-count difference between an n-gram and the keyword it matches
+MAX_NGRAM_SIZE = 4          # Longest answer phrase compared against keywords
+MAX_ANSWER_NGRAMS = 128     # Phrases encoded per answer, across all sizes
+
+# Phrases starting or ending with these words add encoding cost without new meaning
+STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "i", "if", "in", "is", "it",
+    "of", "on", "or", "so", "that", "the", "then", "this", "to", "was", "we", "with", "you", "your",
+])
+
+def tokenize(text: str):
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+def ngram_sizes(expected_keywords: list):
+    """Phrase lengths worth comparing, given the keywords' word counts"""
+    sizes = set()
+    for kw in expected_keywords:
+        n = len(tokenize(kw))
+        if n:
+            sizes.update(range(max(1, n - NGRAM_LENGTH_TOLERANCE), min(MAX_NGRAM_SIZE, n + NGRAM_LENGTH_TOLERANCE) + 1))
+    return sorted(sizes)
+
+def _spread(items: list, limit: int):
+    """Pick limit items evenly spaced across items, keeping both ends"""
+    if len(items) <= limit:
+        return items
+    if limit <= 1:
+        return items[:limit]
+    step = (len(items) - 1) / (limit - 1)
+    return [items[round(i * step)] for i in range(limit)]
+
+def answer_ngrams(user_response: str, sizes: list, max_ngrams: int = MAX_ANSWER_NGRAMS):
+    """Collect unique answer phrases of the given sizes, at most max_ngrams in total.
+
+    The budget is shared across sizes, with any share a size doesn't need
+    passed on to the others. When a size has more phrases than its share,
+    they are sampled evenly across the answer rather than truncated.
+    """
+    tokens = tokenize(user_response)
+    phrases_by_size = []
+    for n in sizes:
+        phrases = []
+        seen = set()
+        for i in range(len(tokens) - n + 1):
+            words = tokens[i:i + n]
+            if words[0] in STOPWORDS or words[-1] in STOPWORDS:
+                continue
+            phrase = " ".join(words)
+            if phrase not in seen:
+                seen.add(phrase)
+                phrases.append(phrase)
+        phrases_by_size.append(phrases)
+
+    kept = [[] for _ in sizes]
+    budget = max_ngrams
+    order = sorted(range(len(sizes)), key=lambda k: len(phrases_by_size[k]))
+    for position, k in enumerate(order):
+        kept[k] = _spread(phrases_by_size[k], budget // (len(order) - position))
+        budget -= len(kept[k])
+    return [phrase for phrases in kept for phrase in phrases]
+
+def _mentions(ngram_tokens: list, keyword_tokens: list):
+    """Whether the n-gram contains the keyword's words, allowing suffixes ("rows" for "row")"""
+    size = len(keyword_tokens)
+    return any(
+        all(ngram_tokens[i + j].startswith(keyword_tokens[j]) for j in range(size))
+        for i in range(len(ngram_tokens) - size + 1)
+    )
+
+def candidate_mask(ngrams: list, expected_keywords: list):
+    """Rows are n-grams, columns keywords: may this n-gram earn credit for this keyword?
+
+    The n-gram's word count must be close to the keyword's, and an n-gram that
+    names a different expected keyword ("iserror", "columns") is evidence for
+    that keyword only, never a paraphrase of its neighbours ("iferror", "rows").
+    """
+    keyword_tokens = [tokenize(kw) for kw in expected_keywords]
+    mask = []
+    for ngram in ngrams:
+        tokens = ngram.split()
+        mentioned = [bool(kt) and _mentions(tokens, kt) for kt in keyword_tokens]
+        mask.append([
+            abs(len(tokens) - len(kt)) <= NGRAM_LENGTH_TOLERANCE
+            and not any(m for k, m in enumerate(mentioned) if k != j)
+            for j, kt in enumerate(keyword_tokens)
+        ])
+    return mask
+
+def select_threshold(scored_pairs: list, min_precision: float = 0.95):
+    """Pick the lowest similarity cut-off that keeps precision at min_precision.
+
+    scored_pairs is a list of (similarity, is_match) tuples. Returns
+    (threshold, precision, recall), or None if no cut-off is precise enough.
+    """
+    positives = sum(1 for _, label in scored_pairs if label)
+    best = None
+    for threshold in sorted({score for score, _ in scored_pairs}, reverse=True):
+        accepted = [label for score, label in scored_pairs if score >= threshold]
+        precision = sum(accepted) / len(accepted)
+        if precision < min_precision:
+            continue
+        recall = sum(accepted) / positives if positives else 0.0
+        best = (threshold, precision, recall)
+    return best
@@ -5,23 +5,38 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # Disable oneDNN custom operations
 import warnings
 warnings.filterwarnings('ignore')
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from models import *
 from evaluation_engine import evaluation_engine
+from analytics import analytics_store, FLUSH_INTERVAL_SECONDS, PASS_RATE_DAYS
+from questions import EXCEL_QUESTIONS
+import asyncio
 import random
 from datetime import datetime
 import uuid
 
+async def flush_analytics_periodically():
+    """Batch analytics writes and keep file I/O off the event loop"""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+        await asyncio.to_thread(analytics_store.flush)
+
 # Lifespan event handler (NEW WAY - replaces @app.on_event)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup code
     evaluation_engine.load_models()
+    flush_task = asyncio.create_task(flush_analytics_periodically())
     print("🤖 Backend startup complete - models loaded")
     yield
     # Shutdown code (if any)
+    flush_task.cancel()
+    await asyncio.to_thread(analytics_store.flush)
     print("🛑 Backend shutting down")
 
 app = FastAPI(
@@ -40,51 +55,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Question database
-EXCEL_QUESTIONS = [
-    {
-        "question": "What is the difference between VLOOKUP and HLOOKUP?",
-        "difficulty": "beginner",
-        "expected_keywords": ["vertical", "horizontal", "lookup", "table", "row", "column", "range", "search"],
-        "follow_up": "Can you explain a scenario where HLOOKUP would be more appropriate than VLOOKUP?"
-    },
-    {
-        "question": "How would you use the INDEX-MATCH combination instead of VLOOKUP? What are the advantages?",
-        "difficulty": "intermediate",
-        "expected_keywords": ["index", "match", "flexible", "left lookup", "dynamic", "column reference", "row reference", "array"],
-        "follow_up": "What are the performance implications of using INDEX-MATCH compared to VLOOKUP in large datasets?"
-    },
-    {
-        "question": "Explain how array formulas work in Excel and provide a practical use case.",
-        "difficulty": "advanced",
-        "expected_keywords": ["array", "CSE", "control shift enter", "multiple calculations", "single formula", "spill range", "dynamic arrays"],
-        "follow_up": "How have dynamic arrays in Excel 365 changed the way we work with array formulas?"
-    },
-    {
-        "question": "Describe a situation where you would use pivot tables and how you would create one.",
-        "difficulty": "intermediate",
-        "expected_keywords": ["data analysis", "summarize", "drag and drop", "fields", "filter", "values", "rows", "columns", "aggregate"],
-        "follow_up": "How would you handle data that needs to be updated regularly in a pivot table?"
-    },
-    {
-        "question": "What are Excel macros and how would you create a simple macro to automate a repetitive task?",
-        "difficulty": "advanced",
-        "expected_keywords": ["vba", "visual basic", "automate", "record macro", "module", "subroutine", "code", "automation"],
-        "follow_up": "What are some best practices for writing maintainable VBA code?"
-    },
-    {
-        "question": "How would you use conditional formatting to highlight cells based on specific criteria?",
-        "difficulty": "beginner",
-        "expected_keywords": ["format", "rules", "conditions", "highlight", "data bars", "color scales", "icon sets", "formula"],
-        "follow_up": "Can you create a conditional formatting rule that highlights entire rows based on a cell value?"
-    },
-    {
-        "question": "Explain the purpose of the IFERROR function and provide an example of its usage.",
-        "difficulty": "intermediate",
-        "expected_keywords": ["error", "handle", "iferror", "iserror", "na", "value", "alternative", "clean data"],
-        "follow_up": "When would you choose IFERROR over ISERROR in combination with IF?"
-    }
-]
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc: RequestValidationError):
+    """Return 422s without echoing the input, which may hold a NaN that JSON cannot encode"""
+    errors = [{k: v for k, v in error.items() if k != "input"} for error in exc.errors()]
+    return JSONResponse(status_code=422, content={"detail": jsonable_encoder(errors)})
 
 @app.get("/")
 async def root():
@@ -92,7 +67,11 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "models_loaded": evaluation_engine.models_loaded}
+    return {
+        "status": "healthy",
+        "models_loaded": evaluation_engine.models_loaded,
+        "scoring_mode": evaluation_engine.scoring_mode
+    }
 
 @app.post("/start_interview", response_model=InterviewResponse)
 async def start_interview(request: InterviewRequest):
@@ -124,9 +103,30 @@ async def evaluate_response(request: EvaluationRequest):
             request.expected_keywords,
             request.difficulty
         )
-        return evaluation
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Analytics must never fail a scored answer
+    try:
+        analytics_store.record(request.question, evaluation, source="backend")
+    except Exception as e:
+        print(f"Analytics recording failed: {e}")
+    return evaluation
+
+@app.post("/record_evaluation", response_model=RecordEvaluationResponse)
+async def record_evaluation(request: RecordEvaluationRequest):
+    """Record an evaluation scored outside the backend, e.g. by the frontend"""
+    recorded = analytics_store.record(request.question, request.evaluation.model_dump(), source=request.source)
+    return {"recorded": recorded}
+
+@app.get("/analytics", response_model=AnalyticsResponse)
+async def get_analytics(
+    source: ScoreSource = "frontend",
+    top_keywords: int = Query(10, ge=1, le=100),
+    days: int = Query(PASS_RATE_DAYS, ge=1, le=PASS_RATE_DAYS)
+):
+    """Cohort-wide score percentiles, missed keywords and pass rates for one scoring source"""
+    return analytics_store.snapshot(source, top_keywords, days)
 
 @app.post("/generate_feedback", response_model=FeedbackResponse)
 async def generate_feedback(request: FeedbackRequest):
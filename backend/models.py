@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 
 class Question(BaseModel):
@@ -39,4 +39,50 @@ class FeedbackResponse(BaseModel):
     feedback_report: str
     overall_score: float
     strengths: List[str]
-    improvements: List[str]
\ No newline at end of file
+    improvements: List[str]
+
+ScoreSource = Literal["backend", "frontend"]
+
+class RecordedEvaluation(BaseModel):
+    score: float = Field(ge=0, le=100, allow_inf_nan=False)
+    keywords_missing: List[str] = []
+
+class RecordEvaluationRequest(BaseModel):
+    question: str
+    evaluation: RecordedEvaluation
+    source: ScoreSource = "frontend"
+
+class RecordEvaluationResponse(BaseModel):
+    recorded: bool
+
+class ScoreSummary(BaseModel):
+    count: int
+    mean: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+
+class QuestionAnalytics(BaseModel):
+    question: str
+    difficulty: str
+    scores: ScoreSummary
+    most_missed_keywords: List[str]
+
+class KeywordCount(BaseModel):
+    keyword: str
+    count: int
+
+class DailyPassRate(BaseModel):
+    date: str
+    evaluations: int
+    pass_rate: float
+
+class AnalyticsResponse(BaseModel):
+    source: ScoreSource
+    total_evaluations: int
+    overall: ScoreSummary
+    by_difficulty: Dict[str, ScoreSummary]
+    by_question: List[QuestionAnalytics]
+    most_missed_keywords: List[KeywordCount]
+    pass_rate_by_day: List[DailyPassRate]
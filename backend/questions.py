@@ -0,0 +1,45 @@
+# Question database
+EXCEL_QUESTIONS = [
+    {
+        "question": "What is the difference between VLOOKUP and HLOOKUP?",
+        "difficulty": "beginner",
+        "expected_keywords": ["vertical", "horizontal", "lookup", "table", "row", "column", "range", "search"],
+        "follow_up": "Can you explain a scenario where HLOOKUP would be more appropriate than VLOOKUP?"
+    },
+    {
+        "question": "How would you use the INDEX-MATCH combination instead of VLOOKUP? What are the advantages?",
+        "difficulty": "intermediate",
+        "expected_keywords": ["index", "match", "flexible", "left lookup", "dynamic", "column reference", "row reference", "array"],
+        "follow_up": "What are the performance implications of using INDEX-MATCH compared to VLOOKUP in large datasets?"
+    },
+    {
+        "question": "Explain how array formulas work in Excel and provide a practical use case.",
+        "difficulty": "advanced",
+        "expected_keywords": ["array", "CSE", "control shift enter", "multiple calculations", "single formula", "spill range", "dynamic arrays"],
+        "follow_up": "How have dynamic arrays in Excel 365 changed the way we work with array formulas?"
+    },
+    {
+        "question": "Describe a situation where you would use pivot tables and how you would create one.",
+        "difficulty": "intermediate",
+        "expected_keywords": ["data analysis", "summarize", "drag and drop", "fields", "filter", "values", "rows", "columns", "aggregate"],
+        "follow_up": "How would you handle data that needs to be updated regularly in a pivot table?"
+    },
+    {
+        "question": "What are Excel macros and how would you create a simple macro to automate a repetitive task?",
+        "difficulty": "advanced",
+        "expected_keywords": ["vba", "visual basic", "automate", "record macro", "module", "subroutine", "code", "automation"],
+        "follow_up": "What are some best practices for writing maintainable VBA code?"
+    },
+    {
+        "question": "How would you use conditional formatting to highlight cells based on specific criteria?",
+        "difficulty": "beginner",
+        "expected_keywords": ["format", "rules", "conditions", "highlight", "data bars", "color scales", "icon sets", "formula"],
+        "follow_up": "Can you create a conditional formatting rule that highlights entire rows based on a cell value?"
+    },
+    {
+        "question": "Explain the purpose of the IFERROR function and provide an example of its usage.",
+        "difficulty": "intermediate",
+        "expected_keywords": ["error", "handle", "iferror", "iserror", "na", "value", "alternative", "clean data"],
+        "follow_up": "When would you choose IFERROR over ISERROR in combination with IF?"
+    }
+]
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from analytics import PASS_RATE_DAYS, AnalyticsStore, ScoreSketch
+
+QUESTIONS = [
+    {"question": "Q1", "difficulty": "beginner", "expected_keywords": ["row", "column"]},
+    {"question": "Q2", "difficulty": "advanced", "expected_keywords": ["vba"]},
+]
+
+
+def test_sketch_empty_quantile_and_summary():
+    sketch = ScoreSketch()
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.summary()["mean"] == 0.0
+
+
+def test_sketch_single_item():
+    sketch = ScoreSketch()
+    sketch.add(42.3)
+    assert sketch.quantile(0.0) == sketch.quantile(1.0) == 42.0
+
+
+def test_sketch_clamps_out_of_range_scores():
+    sketch = ScoreSketch()
+    sketch.add(-5)
+    sketch.add(140)
+    assert sketch.quantile(0.0) == 0.0
+    assert sketch.quantile(1.0) == 100.0
+    assert sketch.total == 100.0
+
+
+def test_sketch_score_100_uses_last_bin():
+    sketch = ScoreSketch()
+    sketch.add(100)
+    assert sketch.bins[-1] == 1
+
+
+def test_sketch_merge_matches_single_sketch():
+    left, right, combined = ScoreSketch(), ScoreSketch(), ScoreSketch()
+    for score in range(0, 50):
+        left.add(score)
+        combined.add(score)
+    for score in range(50, 101):
+        right.add(score)
+        combined.add(score)
+    left.merge(right)
+    assert left.bins == combined.bins
+    assert left.summary() == combined.summary()
+
+
+def test_sketch_round_trips_through_dict():
+    sketch = ScoreSketch()
+    for score in (10, 55.5, 90):
+        sketch.add(score)
+    assert ScoreSketch.from_dict(sketch.to_dict()).summary() == sketch.summary()
+
+
+def test_store_ignores_unknown_questions_and_keywords():
+    store = AnalyticsStore(QUESTIONS)
+    assert not store.record("made up question", {"score": 50})
+    assert store.record("Q1", {"score": 80, "keywords_missing": ["row", "injected"]})
+
+    snapshot = store.snapshot("backend")
+    assert snapshot["total_evaluations"] == 1
+    assert [q["question"] for q in snapshot["by_question"]] == ["Q1"]
+    assert snapshot["most_missed_keywords"] == [{"keyword": "row", "count": 1}]
+
+
+def test_store_keeps_sources_apart():
+    store = AnalyticsStore(QUESTIONS)
+    store.record("Q1", {"score": 90}, source="backend")
+    store.record("Q1", {"score": 20}, source="frontend")
+    assert store.snapshot("backend")["overall"]["mean"] == 90
+    assert store.snapshot("frontend")["overall"]["mean"] == 20
+    with pytest.raises(ValueError):
+        store.record("Q1", {"score": 50}, source="elsewhere")
+
+
+def test_store_totals_merge_per_question_sketches():
+    store = AnalyticsStore(QUESTIONS)
+    store.record("Q1", {"score": 40})
+    store.record("Q2", {"score": 80})
+    snapshot = store.snapshot("backend")
+    assert snapshot["total_evaluations"] == 2
+    assert snapshot["overall"]["mean"] == 60
+    assert snapshot["by_difficulty"]["advanced"]["count"] == 1
+
+
+def test_store_pass_rate_by_day():
+    store = AnalyticsStore(QUESTIONS)
+    day = datetime(2026, 1, 5)
+    store.record("Q1", {"score": 90}, recorded_at=day)
+    store.record("Q2", {"score": 30}, recorded_at=day)
+    assert store.snapshot("backend")["pass_rate_by_day"] == [
+        {"date": "2026-01-05", "evaluations": 2, "pass_rate": 0.5}
+    ]
+
+
+def test_store_keeps_a_window_of_days():
+    store = AnalyticsStore(QUESTIONS)
+    for offset in range(PASS_RATE_DAYS + 5):
+        store.record("Q1", {"score": 90}, recorded_at=datetime(2026, 1, 1) + timedelta(days=offset))
+    days = store.snapshot("backend")["pass_rate_by_day"]
+    assert len(days) == PASS_RATE_DAYS
+    assert days[0]["date"] == "2026-01-06"
+    assert len(store.snapshot("backend", days=7)["pass_rate_by_day"]) == 7
+
+
+def test_store_flush_batches_writes(tmp_path):
+    path = tmp_path / "analytics.json"
+    store = AnalyticsStore(QUESTIONS, str(path))
+    store.record("Q1", {"score": 60})
+    assert not path.exists()
+    store.flush()
+    saved = path.stat().st_mtime_ns
+    store.flush()
+    assert path.stat().st_mtime_ns == saved
+
+
+def test_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "analytics.json")
+    store = AnalyticsStore(QUESTIONS, path)
+    store.record("Q1", {"score": 60, "keywords_missing": ["column"]})
+    store.record("Q2", {"score": 75}, source="frontend")
+    store.flush()
+
+    reloaded = AnalyticsStore(QUESTIONS, path)
+    for source in ("backend", "frontend"):
+        assert reloaded.snapshot(source) == store.snapshot(source)
+
+
+def test_store_reload_drops_removed_questions_everywhere(tmp_path):
+    path = str(tmp_path / "analytics.json")
+    store = AnalyticsStore(QUESTIONS, path)
+    store.record("Q1", {"score": 60, "keywords_missing": ["column"]})
+    store.record("Q2", {"score": 75})
+    store.flush()
+
+    snapshot = AnalyticsStore(QUESTIONS[:1], path).snapshot("backend")
+    assert snapshot["total_evaluations"] == 1
+    assert list(snapshot["by_difficulty"]) == ["beginner"]
+    assert snapshot["pass_rate_by_day"][0]["evaluations"] == 1
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+import evaluation_engine
+from evaluation_engine import EvaluationEngine
+
+
+@pytest.fixture
+def stub_models(monkeypatch):
+    """Replace model loaders so no weights are downloaded; records pipeline calls"""
+    pipeline_calls = []
+    monkeypatch.setattr(evaluation_engine, "SentenceTransformer", lambda name: object())
+    monkeypatch.setattr(evaluation_engine, "pipeline", lambda *args, **kwargs: pipeline_calls.append(kwargs))
+    return pipeline_calls
+
+
+def test_unknown_scoring_mode_raises():
+    with pytest.raises(ValueError):
+        EvaluationEngine(scoring_mode="triple")
+
+
+def test_single_mode_without_head_fails_loading(stub_models, monkeypatch, tmp_path):
+    monkeypatch.setattr(evaluation_engine, "QUALITY_HEAD_PATH", str(tmp_path / "missing.npz"))
+    engine = EvaluationEngine(scoring_mode="single")
+    engine.load_models()
+    assert not engine.models_loaded
+    assert engine.classifier is None
+    assert stub_models == []
+
+
+def test_single_mode_loads_head_without_classifier(stub_models, monkeypatch, tmp_path):
+    path = tmp_path / "quality_head.npz"
+    np.savez(path, weights=np.array([0.5, -0.25]), bias=0.1)
+    monkeypatch.setattr(evaluation_engine, "QUALITY_HEAD_PATH", str(path))
+    engine = EvaluationEngine(scoring_mode="single")
+    engine.load_models()
+    assert engine.models_loaded
+    assert stub_models == []
+    weights, bias = engine.quality_head
+    assert weights.tolist() == [0.5, -0.25]
+    assert bias == pytest.approx(0.1)
+
+
+def test_dual_mode_loads_classifier(stub_models):
+    engine = EvaluationEngine(scoring_mode="dual")
+    engine.load_models()
+    assert engine.models_loaded
+    assert len(stub_models) == 1
+
+
+def test_score_quality_is_sigmoid_of_linear_head():
+    engine = EvaluationEngine(scoring_mode="single")
+    engine.quality_head = (np.array([1.0, 2.0, -1.0]), -0.5)
+    embedding = torch.tensor([0.2, 0.3, 0.1])
+    logit = 0.2 + 0.6 - 0.1 - 0.5
+    assert engine._score_quality(embedding) == pytest.approx(1 / (1 + math.exp(-logit)), rel=1e-6)
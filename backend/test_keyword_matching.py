@@ -0,0 +1,73 @@
+from keyword_matching import MAX_ANSWER_NGRAMS, answer_ngrams, candidate_mask, ngram_sizes, select_threshold
+
+LONG_ARRAY_ANSWER = (
+    "Array formulas let one formula work on a whole range of cells instead of a single value, which is useful "
+    "when you need several intermediate results but only care about the final figure. For example, to total "
+    "revenue without a helper column you can multiply the quantity column by the price column and sum the "
+    "products in one step. In older versions of Excel the formula has to be confirmed in a special way, "
+    "otherwise it only calculates the first element and returns the wrong answer. Curly braces then appear "
+    "around it in the formula bar. I use this for conditional totals, counting unique items and lookups with "
+    "more than one criterion. To enter it you type the formula and press Ctrl+Shift+Enter"
+)
+ARRAY_KEYWORDS = ["array", "CSE", "control shift enter", "multiple calculations", "single formula", "spill range", "dynamic arrays"]
+
+
+def test_ngram_sizes_follow_keyword_word_counts():
+    assert ngram_sizes(["vba"]) == [1, 2]
+    assert ngram_sizes(["control shift enter"]) == [2, 3, 4]
+    assert ngram_sizes([]) == []
+
+
+def test_answer_ngrams_empty_answer():
+    assert answer_ngrams("", [1, 2, 3]) == []
+    assert answer_ngrams("one", [2]) == []
+
+
+def test_answer_ngrams_skip_stopword_edges_and_duplicates():
+    ngrams = answer_ngrams("press the key and press the key", [1, 2, 3])
+    assert ngrams == ["press", "key", "press the key", "key and press"]
+
+
+def test_long_answer_keeps_trailing_phrase_within_budget():
+    assert len(LONG_ARRAY_ANSWER.split()) > 100
+    ngrams = answer_ngrams(LONG_ARRAY_ANSWER, ngram_sizes(ARRAY_KEYWORDS))
+    assert len(ngrams) == MAX_ANSWER_NGRAMS
+    assert "ctrl shift enter" in ngrams
+
+
+def test_cap_samples_evenly_across_answer():
+    answer = " ".join(f"w{i}" for i in range(100))
+    ngrams = answer_ngrams(answer, [1], max_ngrams=10)
+    assert ngrams == [f"w{i}" for i in range(0, 100, 11)]
+
+
+def test_budget_unused_by_one_size_goes_to_others():
+    answer = " ".join(f"w{i}" for i in range(20))
+    ngrams = answer_ngrams(answer, [1, 20, 21], max_ngrams=12)
+    assert len(ngrams) == 12
+    assert "w0" in ngrams and "w19" in ngrams
+
+
+def test_candidate_mask_requires_similar_length():
+    mask = candidate_mask(["ctrl shift enter", "enter"], ["control shift enter", "cse"])
+    assert mask == [[True, False], [False, True]]
+
+
+def test_candidate_mask_blocks_neighbouring_keywords():
+    keywords = ["iferror", "iserror", "rows", "columns"]
+    mask = candidate_mask(["iserror", "columns", "fallback"], keywords)
+    assert mask[0] == [False, True, False, False]
+    assert mask[1] == [False, False, False, True]
+    assert mask[2] == [True, True, True, True]
+
+
+def test_select_threshold_prefers_lowest_precise_cut_off():
+    pairs = [(0.9, True), (0.8, True), (0.75, False), (0.7, True), (0.6, True), (0.5, False)]
+    threshold, precision, recall = select_threshold(pairs, min_precision=0.8)
+    assert threshold == 0.6
+    assert precision == 0.8
+    assert recall == 1.0
+
+
+def test_select_threshold_none_when_unreachable():
+    assert select_threshold([(0.9, False), (0.5, True)], min_precision=0.95) is None
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+import main
+from analytics import AnalyticsStore
+from questions import EXCEL_QUESTIONS
+
+QUESTION = EXCEL_QUESTIONS[0]["question"]
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(main.evaluation_engine, "load_models", lambda: None)
+    monkeypatch.setattr(main, "analytics_store", AnalyticsStore(path=str(tmp_path / "analytics.json")))
+    with TestClient(main.app) as client:
+        yield client
+
+
+def post_evaluation(client, evaluation, source="frontend"):
+    body = json.dumps({"question": QUESTION, "evaluation": evaluation, "source": source})
+    return client.post("/record_evaluation", content=body, headers={"content-type": "application/json"})
+
+
+@pytest.mark.parametrize("evaluation", [
+    {"score": None},
+    {"score": float("nan")},
+    {"score": 50, "keywords_missing": [["a"]]},
+    {"score": 50, "keywords_missing": "row"},
+])
+def test_record_evaluation_rejects_malformed_payloads(client, evaluation):
+    assert post_evaluation(client, evaluation).status_code == 422
+    assert client.get("/analytics").json()["total_evaluations"] == 0
+
+
+def test_record_evaluation_counts_per_source(client):
+    assert post_evaluation(client, {"score": 55, "keywords_missing": ["row"]}).json() == {"recorded": True}
+    assert client.get("/analytics").json()["total_evaluations"] == 1
+    assert client.get("/analytics", params={"source": "backend"}).json()["total_evaluations"] == 0
+
+
+def test_evaluate_response_survives_analytics_failure(client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("read-only volume")
+    monkeypatch.setattr(main.analytics_store, "record", fail)
+    response = client.post("/evaluate_response", json={
+        "question": QUESTION, "user_response": "vertical and horizontal lookup",
+        "expected_keywords": ["vertical", "row"], "difficulty": "beginner"
+    })
+    assert response.status_code == 200
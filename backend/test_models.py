@@ -0,0 +1,36 @@
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from models import RecordEvaluationRequest
+
+
+def make_request(**evaluation):
+    return {"question": "Q1", "evaluation": evaluation}
+
+
+def test_record_request_accepts_frontend_evaluation():
+    request = RecordEvaluationRequest(**make_request(
+        score=72.5, keywords_missing=["row"], evaluation="Good answer.", suggestions="More detail."
+    ))
+    assert request.source == "frontend"
+    assert request.evaluation.model_dump() == {"score": 72.5, "keywords_missing": ["row"]}
+
+
+@pytest.mark.parametrize("evaluation", [
+    {"score": None},
+    {"score": math.nan},
+    {"score": -1},
+    {"score": 101},
+    {"score": 50, "keywords_missing": [["a"]]},
+    {"score": 50, "keywords_missing": "row"},
+])
+def test_record_request_rejects_malformed_evaluations(evaluation):
+    with pytest.raises(ValidationError):
+        RecordEvaluationRequest(**make_request(**evaluation))
+
+
+def test_record_request_rejects_unknown_source():
+    with pytest.raises(ValidationError):
+        RecordEvaluationRequest(**make_request(score=50), source="elsewhere")
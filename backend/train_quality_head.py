@@ -0,0 +1,68 @@
+"""Train the quality head used by the single-encoder scoring mode.
+
+Fits a logistic regression on MiniLM embeddings of labeled sample answers,
+reports leave-one-out accuracy next to a length-only baseline and writes the
+weights to quality_head.npz. The samples mix short good answers, long bad
+ones and same-length pairs with opposite labels, so the head only beats the
+baseline if it learns more than answer length.
+
+Run from the backend directory:
+    python train_quality_head.py [samples.json]
+"""
+import json
+import os
+import sys
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from evaluation_engine import QUALITY_HEAD_PATH, SIMILARITY_MODEL_NAME
+
+SAMPLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quality_samples.json')
+
+def fit_logistic_regression(X, y, learning_rate=0.5, epochs=500, l2=0.01):
+    """Batch gradient descent on L2-regularized log loss"""
+    weights = np.zeros(X.shape[1])
+    bias = 0.0
+    for _ in range(epochs):
+        probs = 1 / (1 + np.exp(-(X @ weights + bias)))
+        error = probs - y
+        weights -= learning_rate * (X.T @ error / len(y) + l2 * weights)
+        bias -= learning_rate * error.mean()
+    return weights, bias
+
+def predict(X, weights, bias):
+    return 1 / (1 + np.exp(-(X @ weights + bias)))
+
+def leave_one_out_accuracy(X, y):
+    correct = 0
+    for i in range(len(y)):
+        mask = np.arange(len(y)) != i
+        weights, bias = fit_logistic_regression(X[mask], y[mask])
+        correct += int((predict(X[i:i + 1], weights, bias)[0] >= 0.5) == y[i])
+    return correct / len(y)
+
+def main(samples_path: str = SAMPLES_PATH):
+    with open(samples_path) as f:
+        samples = json.load(f)
+
+    print(f"🔄 Embedding {len(samples)} labeled answers...")
+    model = SentenceTransformer(SIMILARITY_MODEL_NAME)
+    X = model.encode([s["answer"] for s in samples], convert_to_numpy=True)
+    y = np.array([s["label"] for s in samples], dtype=float)
+
+    # Length alone is already scored by length_score, so the head has to beat it
+    word_counts = np.log1p([len(s["answer"].split()) for s in samples])
+    length_only = ((word_counts - word_counts.mean()) / word_counts.std()).reshape(-1, 1)
+    print(f"Length-only baseline leave-one-out accuracy: {leave_one_out_accuracy(length_only, y):.2%}")
+    print(f"Quality head leave-one-out accuracy: {leave_one_out_accuracy(X, y):.2%}")
+
+    weights, bias = fit_logistic_regression(X, y)
+    train_accuracy = ((predict(X, weights, bias) >= 0.5) == y).mean()
+    print(f"Training accuracy: {train_accuracy:.2%}")
+
+    np.savez(QUALITY_HEAD_PATH, weights=weights, bias=bias)
+    print(f"✅ Quality head saved to {QUALITY_HEAD_PATH}")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -1,4 +1,6 @@
 import streamlit as st
+import os
+import requests
 import json
 import random
 import time
@@ -6,6 +8,8 @@ from datetime import datetime
 import re
 from collections import Counter
 
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://localhost:8000")
+
 # Initialize session state
 def initialize_session_state():
     if "interview_state" not in st.session_state:
@@ -120,6 +124,17 @@ def evaluate_response(question, response, question_data):
         "keywords_missing": list(set(expected_keywords) - set(found_keywords))
     }
 
+def record_evaluation(question, evaluation):
+    """Send an evaluation to the backend so it counts towards cohort analytics"""
+    try:
+        requests.post(
+            f"{BACKEND_URL}/record_evaluation",
+            json={"question": question, "evaluation": evaluation, "source": "frontend"},
+            timeout=2
+        )
+    except requests.RequestException as e:
+        print(f"Could not record evaluation: {e}")
+
 def generate_feedback_report():
     """Generate overall feedback based on all responses"""
     if not st.session_state.user_responses:
@@ -305,6 +320,7 @@ def main():
                     if user_response.strip():
                         # Evaluate the response
                         evaluation = evaluate_response(current_question, user_response, current_question_data)
+                        record_evaluation(current_question, evaluation)
                         
                         # Store response and evaluation
                         st.session_state.user_responses.append({
@@ -329,6 +345,7 @@ def main():
                         "keywords_found": [],
                         "keywords_missing": current_question_data.get("expected_keywords", [])
                     }
+                    record_evaluation(current_question, evaluation)
                     
                     st.session_state.user_responses.append({
                         "question": current_question,